@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the Ogex Python binding tests
+"""
+
+import pytest
+
+import ogex
+
+
+SPECIAL_SYNTAX_PATTERNS = [
+    "a*",
+    "a+",
+    "a?",
+    "^hello",
+    "world$",
+    "[abc]+",
+    "cat|dog",
+    r"\G",
+    "(?:hello)(world)",
+]
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    """Compiled special-syntax patterns, keyed by pattern string"""
+    return {p: ogex.compile(p) for p in SPECIAL_SYNTAX_PATTERNS}
+
+
+@pytest.fixture(scope="session")
+def digits_pattern():
+    """Compiled digit-run pattern for the findall benchmark"""
+    return ogex.compile(r"\d+")
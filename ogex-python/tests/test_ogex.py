@@ -4,27 +4,34 @@ Test suite for Ogex Python bindings
 These tests verify the Python bindings work correctly with the `re`-compatible API.
 """
 
+import functools
+
 import pytest
 
+import ogex
+
+
+@functools.lru_cache(maxsize=None)
+def _c(pattern):
+    """Compile a pattern once and reuse it across tests"""
+    return ogex.compile(pattern)
+
 
 class TestCompile:
     """Test regex compilation"""
     
     def test_compile_simple(self):
         """Test compiling a simple pattern"""
-        import ogex
         r = ogex.compile("abc")
         assert r is not None
     
     def test_compile_named_group(self):
         """Test compiling a named group"""
-        import ogex
         r = ogex.compile("(name:hello)")
         assert r is not None
     
     def test_compile_invalid(self):
         """Test compiling an invalid pattern raises error"""
-        import ogex
         with pytest.raises(ValueError):
             ogex.compile("(unclosed")
 
@@ -34,22 +41,19 @@ class TestMatch:
     
     def test_match_at_start(self):
         """Test match at the beginning of string"""
-        import ogex
-        r = ogex.compile("hello")
+        r = _c("hello")
         m = r.match_("hello world")
         assert m is not None
         assert m.text() == "hello"
     
     def test_match_not_at_start(self):
         """Test match fails if pattern not at start"""
-        import ogex
-        r = ogex.compile("world")
+        r = _c("world")
         m = r.match_("hello world")
         assert m is None
     
     def test_match_function(self):
         """Test module-level match function"""
-        import ogex
         m = ogex.match__("hello", "hello world")
         assert m is not None
         assert m.text() == "hello"
@@ -60,22 +64,19 @@ class TestSearch:
     
     def test_search_anywhere(self):
         """Test search finds match anywhere"""
-        import ogex
-        r = ogex.compile("world")
+        r = _c("world")
         m = r.search("hello world")
         assert m is not None
         assert m.text() == "world"
     
     def test_search_no_match(self):
         """Test search returns None if no match"""
-        import ogex
-        r = ogex.compile("xyz")
+        r = _c("xyz")
         m = r.search("hello world")
         assert m is None
     
     def test_search_function(self):
         """Test module-level search function"""
-        import ogex
         m = ogex.search("world", "hello world")
         assert m is not None
         assert m.text() == "world"
@@ -86,23 +87,29 @@ class TestFindAll:
     
     def test_findall_multiple(self):
         """Test findall returns all matches"""
-        import ogex
-        r = ogex.compile("a+")
+        r = _c("a+")
         matches = r.findall("banana")
-        assert len(matches) == 3  # a, a, a
+        spans = [(m.start, m.end, m.text) for m in matches]
+        assert spans == [(1, 2, "a"), (3, 4, "a"), (5, 6, "a")]
+    
+    def test_findall_digits(self):
+        """Test findall returns each run of digits"""
+        r = _c(r"\d+")
+        matches = r.findall("abc 123 def 456 ghi 789")
+        spans = [(m.start, m.end, m.text) for m in matches]
+        assert spans == [(4, 7, "123"), (12, 15, "456"), (20, 23, "789")]
     
     def test_findall_no_match(self):
         """Test findall returns empty list"""
-        import ogex
-        r = ogex.compile("z+")
+        r = _c("z+")
         matches = r.findall("banana")
         assert len(matches) == 0
     
     def test_findall_function(self):
         """Test module-level findall function"""
-        import ogex
         matches = ogex.findall("a+", "banana")
-        assert len(matches) == 3
+        spans = [(m.start, m.end, m.text) for m in matches]
+        assert spans == [(1, 2, "a"), (3, 4, "a"), (5, 6, "a")]
 
 
 class TestSub:
@@ -110,35 +117,36 @@ class TestSub:
     
     def test_sub_simple(self):
         """Test simple substitution"""
-        import ogex
-        r = ogex.compile("a")
+        r = _c("a")
         result = r.sub("X", "banana")
         assert result == "bXnXnX"
     
     def test_sub_with_groups(self):
         """Test substitution with backreferences"""
-        import ogex
-        r = ogex.compile("(a)(b)")
+        r = _c("(a)(b)")
         result = r.sub(r"\2\1", "ab ab")
         assert result == "ba ba"
     
     def test_sub_entire_match(self):
         """Test substitution with \G (entire match)"""
-        import ogex
-        r = ogex.compile("hello")
+        r = _c("hello")
         result = r.sub(r"[\G]", "hello world")
         assert result == "[hello] world"
     
+    def test_sub_entire_match_digits(self):
+        r"""Test \G wraps each run of digits"""
+        r = _c(r"\d+")
+        result = r.sub(r"[\G]", "abc 123 def")
+        assert result == "abc [123] def"
+    
     def test_sub_count(self):
         """Test substitution with count limit"""
-        import ogex
-        r = ogex.compile("a")
+        r = _c("a")
         result = r.sub("X", "banana", count=1)
         assert result == "bXnana"
     
     def test_sub_function(self):
         """Test module-level sub function"""
-        import ogex
         result = ogex.sub("a", "X", "banana")
         assert result == "bXnXnX"
 
@@ -148,16 +156,14 @@ class TestNamedGroups:
     
     def test_named_group_syntax(self):
         """Test (name:pattern) syntax"""
-        import ogex
-        r = ogex.compile("(name:hello)")
+        r = _c("(name:hello)")
         m = r.search("hello world")
         assert m is not None
         assert m.text() == "hello"
     
     def test_named_backref(self):
         """Test \g{name} backreference"""
-        import ogex
-        r = ogex.compile(r"(word:\w+) is \g{word}")
+        r = _c(r"(word:\w+) is \g{word}")
         m = r.search("test is test")
         assert m is not None
 
@@ -167,18 +173,16 @@ class TestRelativeBackref:
     
     def test_relative_backref_last(self):
         """Test \g{-1} references last numbered group"""
-        import ogex
-        r = ogex.compile(r"(a)(b)(c)\g{-1}")
+        r = _c(r"(a)(b)(c)\g{-1}")
         assert r.is_match("abcc")
         assert not r.is_match("abca")
     
     def test_relative_backref_with_named(self):
         """Test relative backrefs exclude named groups"""
-        import ogex
         # Named group excluded from relative counting
         # (name:x)(a)(b) - numbered groups are 2 and 3
         # \g{-1} should reference group 3 (b)
-        r = ogex.compile(r"(name:x)(a)(b)\g{-1}")
+        r = _c(r"(name:x)(a)(b)\g{-1}")
         assert r.is_match("xabb")
 
 
@@ -187,26 +191,22 @@ class TestMatchObject:
     
     def test_match_start(self):
         """Test match start position"""
-        import ogex
         m = ogex.search("world", "hello world")
         assert m.start() == 6
     
     def test_match_end(self):
         """Test match end position"""
-        import ogex
         m = ogex.search("world", "hello world")
         assert m.end() == 11
     
     def test_match_text(self):
         """Test match text"""
-        import ogex
         m = ogex.search("world", "hello world")
         assert m.text() == "world"
     
     def test_match_group(self):
         """Test match group access"""
-        import ogex
-        r = ogex.compile("(a)(b)(c)")
+        r = _c("(a)(b)(c)")
         m = r.search("abc")
         assert m.group(1) == "a"
         assert m.group(2) == "b"
@@ -218,56 +218,93 @@ class TestIsMatch:
     
     def test_is_match_true(self):
         """Test is_match returns True for matching string"""
-        import ogex
-        r = ogex.compile("hello")
+        r = _c("hello")
         assert r.is_match("hello world") is True
     
     def test_is_match_false(self):
         """Test is_match returns False for non-matching string"""
-        import ogex
-        r = ogex.compile("xyz")
+        r = _c("xyz")
         assert r.is_match("hello world") is False
 
 
 class TestSpecialSyntax:
     """Test special regex syntax"""
     
-    def test_quantifiers(self):
+    @pytest.mark.parametrize("pattern,string,expected", [
+        ("a*", "", True),
+        ("a+", "aaa", True),
+        ("a?", "", True),
+    ])
+    def test_quantifiers(self, patterns, pattern, string, expected):
         """Test quantifiers work"""
-        import ogex
-        assert ogex.compile("a*").is_match("")
-        assert ogex.compile("a+").is_match("aaa")
-        assert ogex.compile("a?").is_match("")
+        assert patterns[pattern].is_match(string) is expected
     
-    def test_anchors(self):
+    @pytest.mark.parametrize("pattern,string,expected", [
+        ("^hello", "hello world", True),
+        ("world$", "hello world", True),
+    ])
+    def test_anchors(self, patterns, pattern, string, expected):
         """Test anchors work"""
-        import ogex
-        assert ogex.compile("^hello").is_match("hello world")
-        assert ogex.compile("world$").is_match("hello world")
+        assert patterns[pattern].is_match(string) is expected
     
-    def test_character_classes(self):
+    @pytest.mark.parametrize("pattern,string,expected", [
+        ("[abc]+", "abcabc", True),
+        ("[abc]+", "xyz", False),
+    ])
+    def test_character_classes(self, patterns, pattern, string, expected):
         """Test character classes work"""
-        import ogex
-        r = ogex.compile("[abc]+")
-        assert r.is_match("abcabc")
-        assert not r.is_match("xyz")
-    
-    def test_alternation(self):
+        assert patterns[pattern].is_match(string) is expected
+    
+    @pytest.mark.parametrize("pattern,string,expected", [
+        ("cat|dog", "cat", True),
+        ("cat|dog", "dog", True),
+        ("cat|dog", "bird", False),
+    ])
+    def test_alternation(self, patterns, pattern, string, expected):
         """Test alternation works"""
-        import ogex
-        r = ogex.compile("cat|dog")
-        assert r.is_match("cat")
-        assert r.is_match("dog")
-        assert not r.is_match("bird")
+        assert patterns[pattern].is_match(string) is expected
+    
+    @pytest.mark.parametrize("pattern,string,expected", [
+        (r"\G", "G", True),
+        (r"\G", "g", False),
+    ])
+    def test_g_literal(self, patterns, pattern, string, expected):
+        r"""Test \G in a pattern matches a literal G"""
+        assert patterns[pattern].is_match(string) is expected
     
-    def test_non_capturing_groups(self):
+    def test_non_capturing_groups(self, patterns):
         """Test non-capturing groups work"""
-        import ogex
-        r = ogex.compile("(?:hello)(world)")
+        r = patterns["(?:hello)(world)"]
         m = r.search("helloworld")
         assert m is not None
         assert m.text() == "helloworld"
 
 
+class TestReDoS:
+    """Test patterns prone to catastrophic backtracking finish quickly"""
+    
+    @pytest.mark.timeout(0.5)
+    @pytest.mark.parametrize("n", [20, 25, 30])
+    @pytest.mark.parametrize("pattern,expected", [
+        ("(a+)+$", False),
+        ("(a|aa)+b", True),
+        ("(a|a?)+b", True),
+    ])
+    def test_pathological_pattern(self, pattern, expected, n):
+        """Test nested/overlapping quantifiers run in bounded time"""
+        assert _c(pattern).is_match("a" * n + "b") is expected
+
+
+class TestBenchmark:
+    """Benchmark matching over long inputs"""
+    
+    def test_findall_throughput(self, benchmark, digits_pattern):
+        """Benchmark findall with a single match buried in a long haystack"""
+        haystack = "x" * 10_000 + " 12345 " + "y" * 10_000
+        matches = benchmark(digits_pattern.findall, haystack)
+        spans = [(m.start, m.end, m.text) for m in matches]
+        assert spans == [(10_001, 10_006, "12345")]
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))